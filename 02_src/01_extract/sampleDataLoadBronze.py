@@ -1,34 +1,192 @@
 import duckdb
 
 # from numpy import where
-import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
+import logging
+import sys
 
-# import sys
-import importlib.util
+# Module logger, configured in the usage script #
+log = logging.getLogger(__name__)
 
 # Set the path to the configuration file #
 config_path = (
     Path(__file__).parent.parent.parent / "05_config" / "sampleDataConfig.py"
 )  #
 
-# Set the specification for the configuration file #
-spec = importlib.util.spec_from_file_location("sampleDataConfig", config_path)
-
-if spec is None:
-    raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-assert spec is not None
-
 # Import the configuration file #
-sampleDataConfig = importlib.util.module_from_spec(spec)
-
-if spec.loader is not None:
-    spec.loader.exec_module(sampleDataConfig)
-
-# Assign the configuration file to the Config variable #
-Config = sampleDataConfig.Config
+## The 05_config folder is added to the import path, so Python caches the module in sys.modules ##
+## and importing this file again doesn't run the configuration file again ##
+if str(config_path.parent) not in sys.path:
+    sys.path.insert(0, str(config_path.parent))
+
+from sampleDataConfig import Config  # noqa: E402
+
+# How DuckDB's CSV reader reads each of the SEC files #
+## Everything is read as VARCHAR, sub.txt is converted with TRY_CAST and num.txt gets its DOUBLE `value` from the reader ##
+CSV_READ_OPTIONS = {
+    "sub.txt": "delim='\t', header=true, encoding='utf-8', parallel=true, all_varchar=true",
+    "num.txt": (
+        "delim='\t', header=true, encoding='latin-1', parallel=true, all_varchar=true, "
+        "types={'value': 'DOUBLE'}"
+    ),
+    "tag.txt": "delim='\t', header=true, encoding='latin-1', parallel=true, all_varchar=true",
+    "pre.txt": "delim='\t', header=true, encoding='latin-1', parallel=true, all_varchar=true",
+}
+
+# Fields of sub.txt whose NULLs are counted before conversion #
+## Everything is read as VARCHAR, so a NULL here means the value was empty in the source file ##
+SUB_SOURCE_NULL_FIELDS = [
+    "adsh",
+    "cik",
+    "name",
+    "form",
+    "period",
+    "filed",
+    "accepted",
+    "sic",
+    "ein",
+    "fy",
+    "changed",
+    "fye",
+    "instance",
+    "detail",
+    "wksi",
+    "prevrpt",
+    "nciks",
+]
+
+# Built once, the total record count followed by one NULL count per field #
+## The source (read_csv or read_parquet) is added at the end when the file is loaded ##
+SUB_SOURCE_NULL_COUNT_SQL = (
+    "SELECT COUNT(*), "
+    + ", ".join(f"COUNT(*) - COUNT({field})" for field in SUB_SOURCE_NULL_FIELDS)
+    + " FROM "
+)
+
+# The INSERT for bronze_sub with explicit type conversion using TRY_CAST #
+## Built once and shared by every quarter, the source (read_csv or read_parquet) is added at the end ##
+## The ?s are the quarter, the load timestamp and then the path(s) of the source ##
+SUB_INSERT_SQL = """
+    INSERT INTO bronze_sub
+    SELECT 
+        adsh,
+        TRY_CAST(cik AS UINTEGER),
+        name,
+        TRY_CAST(sic AS USMALLINT),
+        countryba,
+        stprba,
+        cityba,
+        zipba,
+        bas1,
+        bas2,
+        baph,
+        countryma,
+        stprma,
+        cityma,
+        zipma,
+        mas1,
+        mas2,
+        countryinc,
+        stprinc,
+        TRY_CAST(ein AS INTEGER),
+        former,
+        TRY_STRPTIME(changed, '%Y%m%d')::DATE,
+        afs,
+        TRY_CAST(wksi AS BOOLEAN),
+        fye,
+        form,
+        TRY_STRPTIME(period, '%Y%m%d')::DATE,
+        TRY_CAST(fy AS USMALLINT),
+        fp,
+        TRY_STRPTIME(filed, '%Y%m%d')::DATE,
+        TRY_CAST(accepted AS TIMESTAMP),
+        TRY_CAST(prevrpt AS BOOLEAN),
+        TRY_CAST(detail AS BOOLEAN),
+        instance,
+        TRY_CAST(nciks AS INTEGER),
+        aciks,
+        
+        -- Metadata --
+        ?,
+        ?
+    FROM """
+
+# The data quality checks for bronze_sub, (check_category, check_type, field_name, severity) #
+SUB_QUALITY_CHECKS = [
+    ("null_check", "required_field", "adsh", "CRITICAL"),
+    ("null_check", "required_field", "cik", "CRITICAL"),
+    ("null_check", "required_field", "name", "CRITICAL"),
+    ("null_check", "required_field", "wksi", "CRITICAL"),
+    ("null_check", "required_field", "form", "CRITICAL"),
+    ("null_check", "required_field", "period", "CRITICAL"),
+    ("null_check", "required_field", "filed", "CRITICAL"),
+    ("null_check", "required_field", "accepted", "CRITICAL"),
+    ("null_check", "required_field", "prevrpt", "CRITICAL"),
+    ("null_check", "required_field", "instance", "CRITICAL"),
+    ("null_check", "required_field", "nciks", "CRITICAL"),
+    ("type_conversion", "integer_conversion", "cik", "CRITICAL"),
+    ("type_conversion", "integer_conversion", "sic", "WARNING"),
+    ("type_conversion", "integer_conversion", "ein", "WARNING"),
+    ("type_conversion", "integer_conversion", "fy", "WARNING"),
+    ("type_conversion", "date_conversion", "period", "CRITICAL"),
+    ("type_conversion", "date_conversion", "filed", "CRITICAL"),
+    ("type_conversion", "date_conversion", "changed", "WARNING"),
+    ("type_conversion", "date_conversion", "fye", "WARNING"),
+    ("type_conversion", "boolean_conversion", "wksi", "WARNING"),
+    ("type_conversion", "boolean_conversion", "prevrpt", "WARNING"),
+    ("type_conversion", "timestamp_conversion", "accepted", "CRITICAL"),
+    # wksi conversion
+]
+
+
+@lru_cache(maxsize=None)
+def null_count_sql(table_name: str, fields: tuple) -> str:
+    """Build (once per table and fields) the query that counts the NULLs of every field for a quarter
+
+    Args:
+        table_name: Name of the bronze table being checked
+        fields: The fields to count the NULLs of
+
+    Returns:
+        The query, the total record count followed by one NULL count per field
+    """
+    return (
+        "SELECT COUNT(*), "
+        + ", ".join(f"COUNT(*) - COUNT({field})" for field in fields)
+        + f" FROM {table_name} WHERE data_quarter = ?"
+    )
+
+
+# The INSERT for the data quality log, the VALUES rows are added by data_quality_log_insert_sql #
+DATA_QUALITY_LOG_INSERT_SQL = """
+    INSERT INTO data_quality_log (
+        table_name, data_quarter, load_timestamp,
+        check_category, check_type, field_name,
+        issue_count, total_records, issue_percentage,
+        check_passed, severity, error_details
+    ) VALUES """
+
+# One VALUES row of the data quality log INSERT, one placeholder per column #
+DATA_QUALITY_LOG_ROW_SQL = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+@lru_cache(maxsize=None)
+def data_quality_log_insert_sql(row_count: int) -> str:
+    """Build (once per row count) the INSERT that writes every check of a load to the data quality log
+
+    Args:
+        row_count: The number of checks being logged
+
+    Returns:
+        The INSERT with one VALUES row per check
+    """
+    return DATA_QUALITY_LOG_INSERT_SQL + ", ".join(
+        [DATA_QUALITY_LOG_ROW_SQL] * row_count
+    )
 
 
 class BronzeLoader:
@@ -56,9 +214,28 @@ class BronzeLoader:
         # Connect to the bronze database #
         self.conn = duckdb.connect(str(bronze_db_path))
 
+        # Don't keep the file's row order in the bronze tables #
+        ## Without this, DuckDB buffers rows so an INSERT ... SELECT FROM read_csv keeps the file order ##
+        ## With it, rows stream from the reader into the table and memory stays flat, even for num.txt ##
+        self.conn.execute("SET preserve_insertion_order = false")
+
+        # Apply the DuckDB settings the configuration file sets, the rest keep DuckDB's defaults #
+        ## The settings are global, so every quarter's cursor uses the same thread pool and memory limit ##
+        if config.bronze_threads:
+            self.conn.execute(f"SET threads = {int(config.bronze_threads)}")
+        if config.bronze_memory_limit:
+            self.conn.execute("SET memory_limit = ?", [str(config.bronze_memory_limit)])
+        if config.bronze_temp_directory:
+            self.conn.execute(
+                "SET temp_directory = ?", [str(config.bronze_temp_directory)]
+            )
+
         # Initialize data quality infrastructure
         self._initialize_data_quality_infrastructure()
 
+        # Initialize the bronze tables
+        self._initialize_bronze_tables()
+
     ##################################################################################################################
     # Step 2: Initialize data quality infrastructure
     ##################################################################################################################
@@ -72,9 +249,10 @@ class BronzeLoader:
         """)
 
         # Create unified data quality log table for all bronze tables
+        ## log_id comes from the sequence, so it has no PRIMARY KEY and no index to maintain on every insert ##
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS data_quality_log (
-                log_id INTEGER PRIMARY KEY DEFAULT nextval('seq_data_quality_log'),
+                log_id BIGINT DEFAULT nextval('seq_data_quality_log'),
                 table_name VARCHAR NOT NULL,
                 data_quarter VARCHAR NOT NULL,
                 load_timestamp TIMESTAMP NOT NULL,
@@ -90,13 +268,152 @@ class BronzeLoader:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        print("✓ Data quality infrastructure initialized")
+        log.info("✓ Data quality infrastructure initialized")
+
+    ##################################################################################################################
+    # Step 3: Initialize the bronze tables
+    ##################################################################################################################
+
+    def _initialize_bronze_tables(self):
+        """Create the bronze tables for the files in my configuration file
+
+        The tables are created once here instead of inside each load, so quarters that are
+        loaded at the same time don't race to create the same table
+        """
+        files_to_load = self.config.bronze_files_to_load
+
+        if "sub.txt" in files_to_load:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS bronze_sub (
+                    -- Primary Identifier --
+                    adsh VARCHAR(20) NOT NULL,
+                
+                    -- Company Identifier --
+                    -- CIKs are positive and currently 7 digits (UINTEGER holds up to 4,294,967,295), SIC codes are 4 digits --
+                    cik UINTEGER NOT NULL,
+                    name VARCHAR(150) NOT NULL,
+                    sic USMALLINT,
+
+                    -- Business Address fields --                
+                    countryba VARCHAR(2),
+                    stprba VARCHAR(2),
+                    cityba VARCHAR(30),
+                    zipba VARCHAR(10),
+                    bas1 VARCHAR(40),
+                    bas2 VARCHAR(40),
+                    baph VARCHAR(20),
+
+                    -- Mailing Address fields --
+                    countryma VARCHAR(2),
+                    stprma VARCHAR(2),
+                    cityma VARCHAR(30),
+                    zipma VARCHAR(10),
+                    mas1 VARCHAR(40),
+                    mas2 VARCHAR(40),
+
+                    -- Incorporation Address fields --
+                    countryinc VARCHAR(3),
+                    stprinc VARCHAR(2),
+                    ein INTEGER,
+
+                    -- Company Name History --
+                    former VARCHAR(150),
+                    changed VARCHAR(8),
+
+                    -- Filing Characteristics --
+                    afs VARCHAR(5),
+                    wksi BOOLEAN NOT NULL,
+                    fye VARCHAR(4),
+                    form VARCHAR(10) NOT NULL,
+
+                    -- Period Information --
+                    -- fy is a 4 digit year --
+                    period DATE,
+                    fy USMALLINT,
+                    fp VARCHAR(2),
+
+                    -- Filing Dates -- 
+                    filed DATE,
+                    accepted TIMESTAMP NOT NULL,
+
+                    -- Additional flags --
+                    prevrpt BOOLEAN,
+                    detail BOOLEAN,
+
+                    -- Instance Information
+                    instance VARCHAR(40),
+                    nciks INTEGER,
+                    aciks VARCHAR,
+
+                    -- Metadata --
+                    data_quarter VARCHAR,
+                    load_timestamp TIMESTAMP
+                )
+            """)
+
+        if "num.txt" in files_to_load:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS bronze_num (
+                    adsh VARCHAR,
+                    tag VARCHAR,
+                    version VARCHAR,
+                    coreg VARCHAR,
+                    ddate VARCHAR,
+                    qtrs VARCHAR,
+                    uom VARCHAR,
+                    value DOUBLE,
+                    footnote VARCHAR,
+                    data_quarter VARCHAR,
+                    load_timestamp TIMESTAMP
+                )
+            """)
+
+        if "tag.txt" in files_to_load:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS bronze_tag (
+                    tag VARCHAR,
+                    version VARCHAR,
+                    custom VARCHAR,
+                    abstract VARCHAR,
+                    datatype VARCHAR,
+                    iord VARCHAR,
+                    crdr VARCHAR,
+                    tlabel VARCHAR,
+                    doc VARCHAR,
+                    data_quarter VARCHAR,
+                    load_timestamp TIMESTAMP
+                )
+            """)
+
+        if "pre.txt" in files_to_load:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS bronze_pre (
+                    adsh VARCHAR,
+                    report VARCHAR,
+                    line VARCHAR,
+                    stmt VARCHAR,
+                    inpth VARCHAR,
+                    rfile VARCHAR,
+                    tag VARCHAR,
+                    version VARCHAR,
+                    plabel VARCHAR,
+                    negating VARCHAR,
+                    data_quarter VARCHAR,
+                    load_timestamp TIMESTAMP
+                )
+            """)
+        log.info("✓ Bronze tables initialized")
 
     ##################################################################################################################
-    # Step 3: Load files for a single quarter
+    # Step 4: Load files for a single quarter
     ##################################################################################################################
 
-    def load_quarter(self, quarter: str):
+    def load_quarter(
+        self,
+        quarter: str,
+        files_to_load: list | None = None,
+        load_timestamp: Optional[datetime] = None,
+    ):
         """Load all files for a single quarter
 
         This uses my configuration file to know where to load the data,
@@ -105,386 +422,391 @@ class BronzeLoader:
         Args:
          self: The class instance
          quarter: The quarter to load, uses my configuration file to load the data
+         files_to_load: The files to load, defaults to `files_to_load` in my configuration file
+         load_timestamp: The timestamp of the load, defaults to when the quarter's transaction starts
         """
         # Used for logging in the terminal #
-        print(f"Loading {quarter} into bronze layer...")
-
-        # Defining the path to the quarter #
-        ## The `bronze_path` is defined in my configuration file ##
-        ## quarter is defined at the end of the function, and grabs each quarter from `quarters` in my configuration file ##
-        quarter_path = self.config.bronze_path / quarter
+        log.info(f"Loading {quarter} into bronze layer...")
 
         # Load each file type based on configuration
         ## Get the list of files to load from the configuration file ##
+        if files_to_load is None:
+            files_to_load = self.config.bronze_files_to_load
+
+        self._load_files(files_to_load, [quarter], load_timestamp)
+
+        # Used for logging in the terminal #
+        log.info(f"✓ {quarter} loaded successfully")
+
+    ##################################################################################################################
+    # Step 5: Load several quarters at the same time
+    ##################################################################################################################
+
+    def load_quarters(self, quarters: list, max_workers: Optional[int] = None):
+        """Load several quarters
+
+        1. sub.txt is loaded per quarter in parallel. DuckDB releases the GIL while it runs a query,
+           so each quarter is loaded on its own thread (with its own cursor) and the quarters overlap
+        2. num.txt, tag.txt and pre.txt are each loaded for every quarter in one statement,
+           so DuckDB reads all of the quarters' files in parallel
+
+        Args:
+         self: The class instance
+         quarters: The quarters to load, usually `quarters` from my configuration file
+         max_workers: The most quarters that are loaded at the same time, defaults to `max_workers` from my configuration file
+        """
+        if not quarters:
+            return
+
+        if max_workers is None:
+            max_workers = self.config.bronze_max_workers
+
         files_to_load = self.config.bronze_files_to_load
 
+        # One timestamp for the whole run, so every table loaded by it has the same load_timestamp #
+        load_timestamp = datetime.now()
+
         if "sub.txt" in files_to_load:
-            self._load_sub(
-                quarter_path, quarter
-            )  # This is where I load the submission data #
-        if "num.txt" in files_to_load:
-            self._load_num(
-                quarter_path, quarter
-            )  # This is where I load the numeric data #
-        if "tag.txt" in files_to_load:
-            self._load_tag(quarter_path, quarter)  # This is where I load the tag data #
-        if "pre.txt" in files_to_load:
-            self._load_pre(
-                quarter_path, quarter
-            )  # This is where I load the presentation data #
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(quarters))
+            ) as pool:
+                futures = [
+                    pool.submit(self.load_quarter, quarter, ["sub.txt"], load_timestamp)
+                    for quarter in quarters
+                ]
+
+                # Calling result() re-raises any error from a quarter that failed #
+                for future in futures:
+                    future.result()
+
+        bulk_files = [file for file in files_to_load if file != "sub.txt"]
+        if bulk_files:
+            log.info(
+                f"Loading {', '.join(bulk_files)} for {len(quarters)} quarter(s)..."
+            )
+            self._load_files(bulk_files, quarters, load_timestamp)
+            log.info("✓ All quarters loaded successfully")
 
-        # Used for logging in the terminal #
-        print(f"✓ {quarter} loaded successfully")
+        # Refresh the table statistics once, after every quarter is loaded #
+        ## The query planner uses them to pick join orders, there is no need to do this per quarter ##
+        self.conn.execute("ANALYZE")
+
+    def _load_files(
+        self,
+        files_to_load: list,
+        quarters: list,
+        load_timestamp: Optional[datetime] = None,
+    ):
+        """Load the files for the given quarters in one transaction
+
+        The files are committed once instead of once per INSERT.
+        If one file fails, everything is rolled back instead of being half loaded.
+        Each call gets its own cursor, so several calls can run at the same time.
+
+        Args:
+         self: The class instance
+         files_to_load: The files to load ("sub.txt", "num.txt", "tag.txt", "pre.txt")
+         quarters: The quarters to load the files for
+         load_timestamp: The timestamp of the load, defaults to when the transaction starts
+        """
+        with self.conn.cursor() as conn:
+            conn.begin()
+
+            # One timestamp for the whole transaction, used for the rows of every table and the data quality log #
+            if load_timestamp is None:
+                load_timestamp = datetime.now()
+
+            try:
+                if "sub.txt" in files_to_load:
+                    # Defining the path to the quarter #
+                    ## The `bronze_path` is defined in my configuration file ##
+                    for quarter in quarters:
+                        quarter_path = self.config.bronze_path / quarter
+                        self._load_sub(
+                            conn, quarter_path, quarter, load_timestamp
+                        )  # This is where I load the submission data #
+                if "num.txt" in files_to_load:
+                    self._load_num(
+                        conn, quarters, load_timestamp
+                    )  # This is where I load the numeric data #
+                if "tag.txt" in files_to_load:
+                    self._load_tag(
+                        conn, quarters, load_timestamp
+                    )  # This is where I load the tag data #
+                if "pre.txt" in files_to_load:
+                    self._load_pre(
+                        conn, quarters, load_timestamp
+                    )  # This is where I load the presentation data #
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
 
     ##################################################################################################################
-    # Step 4: Load submission data
+    # Step 6: Read the source files, from the Parquet cache when it is turned on
     ##################################################################################################################
 
-    def _load_sub(self, quarter_path: Path, quarter: str):
+    def _read_source(
+        self, conn: duckdb.DuckDBPyConnection, file_paths: list
+    ) -> tuple[str, list]:
+        """Decide how DuckDB reads one of the SEC .txt files for one or more quarters
+
+        The files are read with `filename=true`, so the quarter of each row can be taken
+        from the quarter folder its file is in
+
+        Args:
+         self: The class instance
+         conn: The DuckDB connection (cursor) of the load
+         file_paths: The paths to the .txt files, all of the same file type
+
+        Returns:
+         The table function to select from (with a ? for the paths) and the list of paths to bind to it
+        """
+        if not self.config.bronze_parquet_cache:
+            return (
+                f"read_csv(?, {CSV_READ_OPTIONS[file_paths[0].name]}, "
+                "filename=true, union_by_name=true)",
+                [str(file_path) for file_path in file_paths],
+            )
+
+        return "read_parquet(?, filename=true, union_by_name=true)", [
+            str(self._to_parquet_cache(conn, file_path)) for file_path in file_paths
+        ]
+
+    def _to_parquet_cache(
+        self, conn: duckdb.DuckDBPyConnection, file_path: Path
+    ) -> Path:
+        """Convert a .txt file to a ZSTD compressed .parquet file next to it
+
+        SEC files don't change once they are published, so the .txt file is only parsed the first time.
+        Every load after that reads the smaller, columnar .parquet file instead.
+        The .parquet file is rebuilt if the .txt file is newer than it.
+        A change to CSV_READ_OPTIONS isn't noticed, the .parquet files have to be deleted for that.
+
+        Args:
+         self: The class instance
+         conn: The DuckDB connection (cursor) of the quarter being loaded
+         file_path: The path to the .txt file
+
+        Returns:
+         The path to the .parquet file
+        """
+        parquet_path = file_path.with_suffix(".parquet")
+
+        if (
+            parquet_path.exists()
+            and parquet_path.stat().st_mtime >= file_path.stat().st_mtime
+        ):
+            return parquet_path
+
+        # Write to a temporary file first, so a failed conversion never leaves half a cache behind #
+        temp_path = parquet_path.with_suffix(".parquet.tmp")
+        conn.sql(
+            f"SELECT * FROM read_csv(?, {CSV_READ_OPTIONS[file_path.name]})",
+            params=[str(file_path)],
+        ).write_parquet(str(temp_path), compression="zstd")
+        temp_path.replace(parquet_path)
+
+        # The quarter is the folder the file is in #
+        log.info(
+            f"  ✓ {file_path.parent.name}: Cached {file_path.name} as {parquet_path.name}"
+        )
+        return parquet_path
+
+    ##################################################################################################################
+    # Step 7: Load submission data
+    ##################################################################################################################
+
+    def _load_sub(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        quarter_path: Path,
+        quarter: str,
+        load_timestamp: datetime,
+    ):
         """Load submission data
 
-        1. Reads the sub.txt file into a pandas dataframe
-        2. Adds metadata columns to the dataframe
-        3. Creates the bronze_sub table if it doesn't exist
-        4. Inserts the dataframe into the bronze_sub table with explicit type conversion using TRY_CAST
-        5. Tracks data quality metrics in a permanent audit table
+        1. Counts the NULLs from the source file (the sub.txt CSV, or its parquet cache when that is turned on)
+        2. Reads the same source straight into the bronze_sub table with explicit type conversion using TRY_CAST
+        3. Tracks data quality metrics in a permanent audit table
 
         Args:
          self: The class instance
+         conn: The DuckDB connection (cursor) of the quarter being loaded
          quarter_path: The path to the quarter
          quarter: The quarter to load, uses my configuration file to load the data
+         load_timestamp: The timestamp of the load, shared by the rows and the data quality log
         """
 
         # Defining the path to the sub.txt file #
         file_path = quarter_path / "sub.txt"
 
-        # Reading the sub.txt file with pandas #
-        df = pd.read_csv(
-            file_path,
-            sep="\t",
-            encoding="utf-8",
-            dtype=str,  # Read everything as string initially
-            low_memory=False,
-        )
-
-        # Add metadata columns
-        df["data_quarter"] = quarter
-        df["load_timestamp"] = datetime.now()
-
-        total_source_records = len(df)
-        load_timestamp = datetime.now()
-
         # Track source data quality BEFORE conversion
-        source_null_counts = {}
-        for field in [
-            "adsh",
-            "cik",
-            "name",
-            "form",
-            "period",
-            "filed",
-            "accepted",
-            "sic",
-            "ein",
-            "fy",
-            "changed",
-            "fye",
-            "instance",
-            "detail",
-            "wksi",
-            "prevrpt",
-            "accepted",
-            "nciks",
-        ]:
-            source_null_counts[field] = int(df[field].isna().sum())
-
-        # Create or append to DuckDB table
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS bronze_sub (
-                -- Primary Identifier --
-                adsh VARCHAR(20) NOT NULL,
-                
-                -- Company Identifier --
-                cik INTEGER NOT NULL,
-                name VARCHAR(150) NOT NULL,
-                sic INTEGER,
-
-                -- Business Address fields --                
-                countryba VARCHAR(2),
-                stprba VARCHAR(2),
-                cityba VARCHAR(30),
-                zipba VARCHAR(10),
-                bas1 VARCHAR(40),
-                bas2 VARCHAR(40),
-                baph VARCHAR(20),
-
-                -- Mailing Address fields --
-                countryma VARCHAR(2),
-                stprma VARCHAR(2),
-                cityma VARCHAR(30),
-                zipma VARCHAR(10),
-                mas1 VARCHAR(40),
-                mas2 VARCHAR(40),
-
-                -- Incorporation Address fields --
-                countryinc VARCHAR(3),
-                stprinc VARCHAR(2),
-                ein INTEGER,
-
-                -- Company Name History --
-                former VARCHAR(150),
-                changed VARCHAR(8),
-
-                -- Filing Characteristics --
-                afs VARCHAR(5),
-                wksi BOOLEAN NOT NULL,
-                fye VARCHAR(4),
-                form VARCHAR(10) NOT NULL,
-
-                -- Period Information --
-                period DATE,
-                fy INTEGER,
-                fp VARCHAR(2),
-
-                -- Filing Dates -- 
-                filed DATE,
-                accepted TIMESTAMP NOT NULL,
-
-                -- Additional flags --
-                prevrpt BOOLEAN,
-                detail BOOLEAN,
-
-                -- Instance Information
-                instance VARCHAR(40),
-                nciks INTEGER,
-                aciks VARCHAR,
-
-                -- Metadata --
-                data_quarter VARCHAR,
-                load_timestamp TIMESTAMP
-            )
-        """)
+        ## One scan of the raw file counts the NULLs of every field at once ##
+        source, source_paths = self._read_source(conn, [file_path])
+        result = conn.execute(
+            SUB_SOURCE_NULL_COUNT_SQL + source, [source_paths]
+        ).fetchone()
 
-        self.conn.register("sub_df", df)
+        total_source_records = int(result[0]) if result else 0
+        source_null_counts = {
+            field: int(result[i + 1]) if result else 0
+            for i, field in enumerate(SUB_SOURCE_NULL_FIELDS)
+        }
 
         # Insert data with explicit type conversion using TRY_CAST #
         ## TRY_CAST us used only on columns that are not strings ##
-        self.conn.execute("""
-            INSERT INTO bronze_sub
-            SELECT 
-                adsh,
-                TRY_CAST(cik AS INTEGER),
-                name,
-                TRY_CAST(sic AS INTEGER),
-                countryba,
-                stprba,
-                cityba,
-                zipba,
-                bas1,
-                bas2,
-                baph,
-                countryma,
-                stprma,
-                cityma,
-                zipma,
-                mas1,
-                mas2,
-                countryinc,
-                stprinc,
-                TRY_CAST(ein AS INTEGER),
-                former,
-                TRY_STRPTIME(changed, '%Y%m%d')::DATE,
-                afs,
-                TRY_CAST(wksi AS BOOLEAN),
-                TRY_CAST(fye AS VARCHAR(4)),
-                form,
-                TRY_STRPTIME(period, '%Y%m%d')::DATE,
-                TRY_CAST(fy AS INTEGER),
-                fp,
-                TRY_STRPTIME(filed, '%Y%m%d')::DATE,
-                TRY_CAST(accepted AS TIMESTAMP),
-                TRY_CAST(prevrpt AS BOOLEAN),
-                TRY_CAST(detail AS BOOLEAN),
-                instance,
-                TRY_CAST(nciks AS INTEGER),
-                aciks,
-                
-                -- Metadata --
-                data_quarter,
-                TRY_CAST(load_timestamp AS TIMESTAMP)
-            FROM sub_df
-        """)
-
-        self.conn.unregister("sub_df")
+        ## DuckDB parses the file and converts the types in one pass, no pandas in between ##
+        conn.execute(
+            SUB_INSERT_SQL + source,
+            [quarter, load_timestamp, source_paths],
+        )
 
         # Track data quality
-        quality_checks = [
-            ("null_check", "required_field", "adsh", "CRITICAL"),
-            ("null_check", "required_field", "cik", "CRITICAL"),
-            ("null_check", "required_field", "name", "CRITICAL"),
-            ("null_check", "required_field", "wksi", "CRITICAL"),
-            ("null_check", "required_field", "form", "CRITICAL"),
-            ("null_check", "required_field", "period", "CRITICAL"),
-            ("null_check", "required_field", "filed", "CRITICAL"),
-            ("null_check", "required_field", "accepted", "CRITICAL"),
-            ("null_check", "required_field", "prevrpt", "CRITICAL"),
-            ("null_check", "required_field", "instance", "CRITICAL"),
-            ("null_check", "required_field", "nciks", "CRITICAL"),
-            ("type_conversion", "integer_conversion", "cik", "CRITICAL"),
-            ("type_conversion", "integer_conversion", "sic", "WARNING"),
-            ("type_conversion", "integer_conversion", "ein", "WARNING"),
-            ("type_conversion", "integer_conversion", "fy", "WARNING"),
-            ("type_conversion", "date_conversion", "period", "CRITICAL"),
-            ("type_conversion", "date_conversion", "filed", "CRITICAL"),
-            ("type_conversion", "date_conversion", "changed", "WARNING"),
-            ("type_conversion", "date_conversion", "fye", "WARNING"),
-            ("type_conversion", "boolean_conversion", "wksi", "WARNING"),
-            ("type_conversion", "boolean_conversion", "prevrpt", "WARNING"),
-            ("type_conversion", "timestamp_conversion", "accepted", "CRITICAL"),
-            # wksi conversion
-        ]
 
         self._log_data_quality(
+            conn,
             table_name="bronze_sub",
             quarter=quarter,
             load_timestamp=load_timestamp,
-            quality_checks=quality_checks,
+            quality_checks=SUB_QUALITY_CHECKS,
             total_records=total_source_records,
             source_null_counts=source_null_counts,
         )
-        print(f"  ✓ Loaded {total_source_records:,} submissions from sub.txt")
+        log.info(
+            f"  ✓ {quarter}: Loaded {total_source_records:,} submissions from sub.txt"
+        )
 
     ##################################################################################################################
-    # Step 5: Load numeric facts data
+    # Step 8: Load numeric facts data
     ##################################################################################################################
 
-    def _load_num(self, quarter_path: Path, quarter: str):
-        """Load numeric facts data"""
-        file_path = quarter_path / "num.txt"
-
-        df = pd.read_csv(
-            file_path,
-            sep="\t",
-            encoding="latin-1",
-            dtype={
-                "adsh": str,
-                "tag": str,
-                "version": str,
-                "coreg": str,
-                "ddate": str,
-                "qtrs": str,
-                "uom": str,
-                "value": float,
-                "footnote": str,
-            },
-            low_memory=False,
-        )
+    def _load_num(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        quarters: list,
+        load_timestamp: datetime,
+    ):
+        """Load numeric facts data
 
-        df["data_quarter"] = quarter
-        df["load_timestamp"] = datetime.now()
+        Every quarter's num.txt is read in one statement,
+        data_quarter comes from the quarter folder each file is in
 
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS bronze_num (
-                adsh VARCHAR,
-                tag VARCHAR,
-                version VARCHAR,
-                coreg VARCHAR,
-                ddate VARCHAR,
-                qtrs VARCHAR,
-                uom VARCHAR,
-                value DOUBLE,
-                footnote VARCHAR,
-                data_quarter VARCHAR,
-                load_timestamp TIMESTAMP
-            )
-        """)
+        Args:
+         self: The class instance
+         conn: The DuckDB connection (cursor) of the load
+         quarters: The quarters to load
+         load_timestamp: The timestamp of the load, shared with the other tables of the same load
+        """
+        file_paths = [
+            self.config.bronze_path / quarter / "num.txt" for quarter in quarters
+        ]
 
-        self.conn.register("num_df", df)
-        self.conn.execute("INSERT INTO bronze_num SELECT * FROM num_df")
-        self.conn.unregister("num_df")
+        # Columns are selected by name, so the column order of num.txt doesn't matter #
+        source, source_paths = self._read_source(conn, file_paths)
+        result = conn.execute(
+            f"""
+            INSERT INTO bronze_num
+            SELECT
+                adsh, tag, version, coreg, ddate, qtrs, uom, value, footnote,
+                parse_filename(parse_dirpath(filename)),
+                ?
+            FROM {source}
+            """,
+            [load_timestamp, source_paths],
+        ).fetchone()
+        row_count = int(result[0]) if result else 0
 
-        print(f"  ✓ Loaded {len(df):,} numeric facts from num.txt")
+        log.info(f"  ✓ Loaded {row_count:,} numeric facts from num.txt")
 
     ##################################################################################################################
-    # Step 6: Load tag definitions
+    # Step 9: Load tag definitions
     ##################################################################################################################
 
-    def _load_tag(self, quarter_path: Path, quarter: str):
-        """Load tag definitions"""
-        file_path = quarter_path / "tag.txt"
-
-        df = pd.read_csv(
-            file_path, sep="\t", encoding="latin-1", dtype=str, low_memory=False
-        )
+    def _load_tag(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        quarters: list,
+        load_timestamp: datetime,
+    ):
+        """Load tag definitions
 
-        df["data_quarter"] = quarter
-        df["load_timestamp"] = datetime.now()
+        Every quarter's tag.txt is read in one statement,
+        data_quarter comes from the quarter folder each file is in
 
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS bronze_tag (
-                tag VARCHAR,
-                version VARCHAR,
-                custom VARCHAR,
-                abstract VARCHAR,
-                datatype VARCHAR,
-                iord VARCHAR,
-                crdr VARCHAR,
-                tlabel VARCHAR,
-                doc VARCHAR,
-                data_quarter VARCHAR,
-                load_timestamp TIMESTAMP
-            )
-        """)
+        Args:
+         self: The class instance
+         conn: The DuckDB connection (cursor) of the load
+         quarters: The quarters to load
+         load_timestamp: The timestamp of the load, shared with the other tables of the same load
+        """
+        file_paths = [
+            self.config.bronze_path / quarter / "tag.txt" for quarter in quarters
+        ]
 
-        self.conn.register("tag_df", df)
-        self.conn.execute("INSERT INTO bronze_tag SELECT * FROM tag_df")
-        self.conn.unregister("tag_df")
+        source, source_paths = self._read_source(conn, file_paths)
+        result = conn.execute(
+            f"""
+            INSERT INTO bronze_tag
+            SELECT
+                tag, version, custom, abstract, datatype, iord, crdr, tlabel, doc,
+                parse_filename(parse_dirpath(filename)),
+                ?
+            FROM {source}
+            """,
+            [load_timestamp, source_paths],
+        ).fetchone()
+        row_count = int(result[0]) if result else 0
 
-        print(f"  ✓ Loaded {len(df):,} tag definitions from tag.txt")
+        log.info(f"  ✓ Loaded {row_count:,} tag definitions from tag.txt")
 
     ##################################################################################################################
-    # Step 7: Load presentation data
+    # Step 10: Load presentation data
     ##################################################################################################################
 
-    def _load_pre(self, quarter_path: Path, quarter: str):
-        """Load presentation data"""
-        file_path = quarter_path / "pre.txt"
-
-        df = pd.read_csv(
-            file_path, sep="\t", encoding="latin-1", dtype=str, low_memory=False
-        )
+    def _load_pre(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        quarters: list,
+        load_timestamp: datetime,
+    ):
+        """Load presentation data
 
-        df["data_quarter"] = quarter
-        df["load_timestamp"] = datetime.now()
+        Every quarter's pre.txt is read in one statement,
+        data_quarter comes from the quarter folder each file is in
 
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS bronze_pre (
-                adsh VARCHAR,
-                report VARCHAR,
-                line VARCHAR,
-                stmt VARCHAR,
-                inpth VARCHAR,
-                rfile VARCHAR,
-                tag VARCHAR,
-                version VARCHAR,
-                plabel VARCHAR,
-                negating VARCHAR,
-                data_quarter VARCHAR,
-                load_timestamp TIMESTAMP
-            )
-        """)
+        Args:
+         self: The class instance
+         conn: The DuckDB connection (cursor) of the load
+         quarters: The quarters to load
+         load_timestamp: The timestamp of the load, shared with the other tables of the same load
+        """
+        file_paths = [
+            self.config.bronze_path / quarter / "pre.txt" for quarter in quarters
+        ]
 
-        self.conn.register("pre_df", df)
-        self.conn.execute("INSERT INTO bronze_pre SELECT * FROM pre_df")
-        self.conn.unregister("pre_df")
+        source, source_paths = self._read_source(conn, file_paths)
+        result = conn.execute(
+            f"""
+            INSERT INTO bronze_pre
+            SELECT
+                adsh, report, line, stmt, inpth, rfile, tag, version, plabel, negating,
+                parse_filename(parse_dirpath(filename)),
+                ?
+            FROM {source}
+            """,
+            [load_timestamp, source_paths],
+        ).fetchone()
+        row_count = int(result[0]) if result else 0
 
-        print(f"  ✓ Loaded {len(df):,} presentation rows from pre.txt")
+        log.info(f"  ✓ Loaded {row_count:,} presentation rows from pre.txt")
 
     ##################################################################################################################
-    # Step 8: Log Data Quality Metrics
+    # Step 11: Log Data Quality Metrics
     ##################################################################################################################
     def _log_data_quality(
         self,
+        conn: duckdb.DuckDBPyConnection,
         table_name: str,
         quarter: str,
         load_timestamp: datetime,
@@ -503,6 +825,7 @@ class BronzeLoader:
         If the target table has more NULLs than the source, those are conversion failures.
 
         Args:
+            conn: The DuckDB connection (cursor) of the quarter being loaded
             table_name: Name of the bronze table being checked
             quarter: Data quarter being processed
             load_timestamp: Timestamp of the load operation
@@ -511,23 +834,25 @@ class BronzeLoader:
             source_null_counts: Dictionary of NULL counts from source data before conversion
         """
         failed_checks = []
+        log_rows = []
+
+        # Count the NULLs of every checked field in one scan of the target table #
+        ## Each check then reads its count from this dict instead of running its own query ##
+        checked_fields = tuple(dict.fromkeys(check[2] for check in quality_checks))
+        result = conn.execute(
+            null_count_sql(table_name, checked_fields), [quarter]
+        ).fetchone()
+
+        total = int(result[0]) if result else 0
+        target_null_counts = {
+            field: int(result[i + 1]) if result else 0
+            for i, field in enumerate(checked_fields)
+        }
 
         for check_category, check_type, field_name, severity in quality_checks:
             if check_category == "null_check":
                 # For null checks, count NULLs in the target table
-                result = self.conn.execute(
-                    f"""
-                    SELECT
-                        COUNT(*) as total_records,
-                        SUM(CASE WHEN {field_name} IS NULL THEN 1 ELSE 0 END) as null_count
-                    FROM {table_name}
-                    WHERE data_quarter = ?
-                    """,
-                    [quarter],
-                ).fetchone()
-
-                total = int(result[0]) if result else 0
-                issue_count = int(result[1]) if result else 0
+                issue_count = target_null_counts[field_name]
                 error_details = (
                     f"{issue_count} NULL values found in {field_name}"
                     if issue_count > 0
@@ -539,20 +864,7 @@ class BronzeLoader:
                 # If target has MORE nulls than source, those are conversion failures
 
                 source_nulls = source_null_counts.get(field_name, 0)
-
-                result = self.conn.execute(
-                    f"""
-                    SELECT
-                        COUNT(*) as total_records,
-                        SUM(CASE WHEN {field_name} IS NULL THEN 1 ELSE 0 END) as null_count
-                    FROM {table_name}
-                    WHERE data_quarter = ?
-                    """,
-                    [quarter],
-                ).fetchone()
-
-                total = int(result[0]) if result else 0
-                target_nulls = int(result[1]) if result else 0
+                target_nulls = target_null_counts[field_name]
 
                 # Conversion failures = target NULLs - source NULLs
                 # (New NULLs that appeared after TRY_CAST failed)
@@ -581,16 +893,8 @@ class BronzeLoader:
             else:
                 check_passed = issue_percentage < 5.0
 
-            # Insert into quality log
-            self.conn.execute(
-                """
-                INSERT INTO data_quality_log (
-                    table_name, data_quarter, load_timestamp,
-                    check_category, check_type, field_name,
-                    issue_count, total_records, issue_percentage,
-                    check_passed, severity, error_details
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            # Collect the row for the quality log, all rows are inserted together after the loop
+            log_rows.append(
                 [
                     table_name,
                     quarter,
@@ -604,29 +908,45 @@ class BronzeLoader:
                     check_passed,
                     severity,
                     error_details,
-                ],
+                ]
             )
 
             # Track failed checks for reporting
             if not check_passed:
                 failed_checks.append((field_name, severity, issue_count, error_details))
 
+        # Insert into quality log
+        ## One multi-row INSERT for every check, so the statement is planned and run once per load ##
+        if log_rows:
+            conn.execute(
+                data_quality_log_insert_sql(len(log_rows)),
+                [value for row in log_rows for value in row],
+            )
+
         # Print warnings if there are failures
+        ## The failures are joined into one message, so they are written out in one call ##
+        ## Quarters are loaded at the same time, so every line names its quarter ##
         if failed_checks:
-            print("  ⚠️  Data quality issues detected:")
-            for field, sev, count, details in failed_checks:
-                print(f"      [{sev}] {field}: {count} issues - {details}")
+            log.warning(
+                "\n".join(
+                    [f"  ⚠️  {quarter} {table_name}: Data quality issues detected:"]
+                    + [
+                        f"      {quarter} [{sev}] {field}: {count} issues - {details}"
+                        for field, sev, count, details in failed_checks
+                    ]
+                )
+            )
         else:
-            print("  ✓ All data quality checks passed")
+            log.info(f"  ✓ {quarter} {table_name}: All data quality checks passed")
 
     ##################################################################################################################
-    # Step 9: Create indexes
+    # Step 12: Create indexes
     ##################################################################################################################
 
     ##### I NEED TO UNDERSTAND IF I NEED TO CREATE INDEXES FOR THE BRONZE LAYER #####
     def create_indexes(self):
         """Create indexes for better query performance"""
-        print("Creating indexes...")
+        log.info("Creating indexes...")
 
         # Key indexes for joins
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_sub_adsh ON bronze_sub(adsh)")
@@ -636,31 +956,28 @@ class BronzeLoader:
         # self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pre_adsh ON bronze_pre(adsh)")
         # self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pre_stmt ON bronze_pre(stmt)")
 
-        print("✓ Indexes created")
+        log.info("✓ Indexes created")
 
     ##### THESE ARE SUMMARY STATS, NEED TO CHECK IF I NEED THIS OR TO ADD MORE #####
     def get_summary_stats(self):
         """Get summary statistics of loaded data"""
         stats = {}
-        result = self.conn.execute("SELECT COUNT(*) FROM bronze_sub").fetchone()
-        stats["submissions"] = result[0] if result else 0
 
+        # One scan of each table computes all of its stats at once #
         result = self.conn.execute(
-            "SELECT COUNT(DISTINCT cik) FROM bronze_sub"
+            "SELECT COUNT(*), COUNT(DISTINCT cik) FROM bronze_sub"
         ).fetchone()
-        stats["companies"] = result[0] if result else 0
-
-        # stats["numeric_facts"] = self.conn.execute(
-        #     "SELECT COUNT(*) FROM bronze_num"
-        # ).fetchone()[0]
+        stats["submissions"] = result[0] if result else 0
+        stats["companies"] = result[1] if result else 0
 
-        # stats["unique_tags"] = self.conn.execute(
-        #     "SELECT COUNT(DISTINCT tag) FROM bronze_num"
-        # ).fetchone()[0]
+        # result = self.conn.execute(
+        #     "SELECT COUNT(*), COUNT(DISTINCT tag) FROM bronze_num"
+        # ).fetchone()
+        # stats["numeric_facts"] = result[0] if result else 0
+        # stats["unique_tags"] = result[1] if result else 0
 
-        # stats["presentation_rows"] = self.conn.execute(
-        #     "SELECT COUNT(*) FROM bronze_pre"
-        # ).fetchone()[0]
+        # result = self.conn.execute("SELECT COUNT(*) FROM bronze_pre").fetchone()
+        # stats["presentation_rows"] = result[0] if result else 0
 
         return stats
 
@@ -671,27 +988,35 @@ class BronzeLoader:
 
 # Usage script
 if __name__ == "__main__":
+    # Configure logging once, messages are printed as-is like the old print output #
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()]
+    )
+
     # Derive YAML config path from the Python config path (replace .py with .yaml)
     config_yaml_path = config_path.with_suffix(".yaml")
     config = Config(str(config_yaml_path))
     loader = BronzeLoader(config)
-    # Create indexes
-    # loader.create_indexes()
 
     # Load all configured quarters
-    for quarter in config.quarters:
-        loader.load_quarter(quarter)
+    loader.load_quarters(config.quarters)
+
+    # Create indexes
+    ## Done after every quarter is loaded, so each index is built once instead of being updated on every INSERT ##
+    ## Off by default, DuckDB's min/max zonemaps already let scans on the bronze tables skip row groups ##
+    if config.bronze_build_indexes:
+        loader.create_indexes()
 
     # Print summary
     stats = loader.get_summary_stats()
-    print("\n" + "=" * 50)
-    print("BRONZE LAYER SUMMARY")
-    print("=" * 50)
-    print(f"Submissions:      {stats['submissions']:,}")
-    print(f"Unique Companies: {stats['companies']:,}")
-    # print(f"Numeric Facts:    {stats['numeric_facts']:,}")
-    # print(f"Unique Tags:      {stats['unique_tags']:,}")
-    # print(f"Presentation Rows: {stats['presentation_rows']:,}")
-    print("=" * 50)
+    log.info("\n" + "=" * 50)
+    log.info("BRONZE LAYER SUMMARY")
+    log.info("=" * 50)
+    log.info(f"Submissions:      {stats['submissions']:,}")
+    log.info(f"Unique Companies: {stats['companies']:,}")
+    # log.info(f"Numeric Facts:    {stats['numeric_facts']:,}")
+    # log.info(f"Unique Tags:      {stats['unique_tags']:,}")
+    # log.info(f"Presentation Rows: {stats['presentation_rows']:,}")
+    log.info("=" * 50)
 
     loader.close()
@@ -1,12 +1,13 @@
 # Importing the necessary libraries
 
-import zipfile  # For extracting the ZIP files
-import requests  # For downloading the files
+## zipfile and requests are imported inside the functions that use them ##
+## so importing this file (e.g. just for log_download_dynamic) doesn't pay for them ##
 import os  # For creating directories, and joining file paths
 from datetime import datetime  # For naming the files with the current date
 from pathlib import Path  # For joining file paths
 import csv  # For creating CSV files for logging
 import json  # For normalizing values for CSV writing
+from concurrent.futures import ThreadPoolExecutor  # For downloading in parallel
 
 
 # Step 0: Anchor this script to the root directory to use my folder structure
@@ -20,6 +21,49 @@ RAW_DIR = ROOT_DIR / "01_data" / "01_sampleData" / "01_raw"
 BRONZE_DIR = ROOT_DIR / "01_data" / "01_sampleData" / "02_bronze"
 LOG_DIR = ROOT_DIR / "06_logs"
 
+# Download settings
+## The SEC allows at most 10 requests per second, so 8 parts plus the HEAD request stay under the limit ##
+DOWNLOAD_PARTS = 8
+## Bytes read from the response and written to the file at a time ##
+CHUNK_SIZE = 1 << 20
+
+
+def download_range(url, headers, zip_path, start, end):
+    """
+    Downloads the bytes from start to end (inclusive) of the file at url and writes them
+    to the same position in the zip file, which must already be the full size.
+
+    Args:
+        url (str): The URL of the file
+        headers (dict): The request headers, including my User-Agent
+        zip_path (str): The path to the zip file being written
+        start (int): The first byte of the part
+        end (int): The last byte of the part
+
+    Returns:
+    - int, the number of bytes written
+    """
+    import requests  # For downloading the files
+
+    response = requests.get(
+        url, headers={**headers, "Range": f"bytes={start}-{end}"}, stream=True
+    )
+    response.raise_for_status()
+
+    # A 200 instead of a 206 means the server sent the whole file, not the part #
+    if response.status_code != 206:
+        raise ValueError(f"Server ignored the range request for bytes {start}-{end}")
+
+    # Each part opens its own file handle, so the parts can write at the same time #
+    written = 0
+    with open(zip_path, "r+b") as f:
+        f.seek(start)
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            f.write(chunk)
+            written += len(chunk)
+
+    return written
+
 
 def download_one_quarter(
     year,
@@ -40,6 +84,8 @@ def download_one_quarter(
     Returns:
     - dict with download metadata (status, size, timing)
     """
+    import zipfile  # For extracting the ZIP files
+    import requests  # For downloading the files
 
     # Step 1: Define the base URL and filename
     ## Base URL is so we know where to pull from ##
@@ -76,19 +122,57 @@ def download_one_quarter(
     start_time = datetime.now()
 
     try:
-        # Make the request with stream=True to handle large files
-        response = requests.get(url, headers=headers, stream=True)
+        # Ask for the file size first, and whether the server accepts range requests
+        head = requests.head(url, headers=headers, allow_redirects=True)
 
         # Check if the request was successful
         ## This raises error for 4xx and 5xx status codes ##
-        response.raise_for_status()
+        head.raise_for_status()
+
+        content_length = int(head.headers.get("Content-Length", 0))
+        accepts_ranges = head.headers.get("Accept-Ranges", "").lower() == "bytes"
 
         # Step 6: Write the ZIP file in chunks (for memory efficiency)
         ## This is so we don't have to load the entire file into memory at once ##
         ## This is where we actually write the file to the raw directory ##
-        with open(zip_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        if accepts_ranges and content_length >= DOWNLOAD_PARTS * CHUNK_SIZE:
+            # Download the file in DOWNLOAD_PARTS parts at the same time #
+            ## The file is sized up front, so every part can write straight to its own position ##
+            with open(zip_path, "wb") as f:
+                f.truncate(content_length)
+
+            part_size = -(-content_length // DOWNLOAD_PARTS)  # Round up
+            ranges = [
+                (start, min(start + part_size, content_length) - 1)
+                for start in range(0, content_length, part_size)
+            ]
+
+            with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                futures = [
+                    pool.submit(download_range, url, headers, zip_path, start, end)
+                    for start, end in ranges
+                ]
+
+                # Calling result() re-raises any error from a part that failed #
+                written = sum(future.result() for future in futures)
+
+            if written != content_length:
+                raise ValueError(
+                    f"Downloaded {written} of {content_length} bytes for {filename}"
+                )
+
+            http_status = head.status_code
+        else:
+            # Make the request with stream=True to handle large files
+            ## Used when the server doesn't accept range requests or the file is small ##
+            response = requests.get(url, headers=headers, stream=True)
+            response.raise_for_status()
+
+            with open(zip_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+
+            http_status = response.status_code
 
         # Get the file size
         file_size = os.path.getsize(zip_path)
@@ -108,15 +192,20 @@ def download_one_quarter(
         extraction_start_time = datetime.now()
 
         # Extract the ZIP file
+        ## Only the four .txt files the pipeline uses are extracted, the rest stays in the raw ZIP ##
+        expected_files = ["sub.txt", "num.txt", "tag.txt", "pre.txt"]
         with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(quarter_extract_path)
+            members = [
+                name for name in zip_ref.namelist() if name.lower() in expected_files
+            ]
+            zip_ref.extractall(quarter_extract_path, members=members)
 
         # Step 8: Verify the extraction
-        extracted_files = os.listdir(quarter_extract_path)
-        expected_files = ["sub.txt", "num.txt", "tag.txt", "pre.txt"]
+        ## The names come from the ZIP's own file list, so the folder doesn't have to be listed again ##
+        extracted_files = members
 
         # Note: SEC files might be uppercase or lowercase, so check case-insensitive
-        extracted_lower = [f.lower() for f in extracted_files]
+        extracted_lower = {f.lower() for f in extracted_files}
 
         missing_files = [f for f in expected_files if f not in extracted_lower]
 
@@ -143,7 +232,7 @@ def download_one_quarter(
             "extract_start": extraction_start_time.isoformat(" "),
             "extract_time": f"{extraction_time.total_seconds()} seconds",
             "extracted_files": extracted_files,
-            "http_status": response.status_code,
+            "http_status": http_status,
         }
 
     except requests.exceptions.HTTPError as e:
@@ -184,37 +273,33 @@ def log_download_dynamic(metadata: dict, log_path):
     log_path = Path(log_path)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Step 2: Check if the file exists
-    write_header = not log_path.exists()
-
-    # Step 3: Normalize values so CSV writes cleanly
+    # Step 2: Normalize values so CSV writes cleanly
     def normalize(v):
         if isinstance(v, (list, dict, set, tuple)):
             return json.dumps(v)
         return str(v)
 
-    # Step 4: Write the header to the file
-    if write_header:
-        fieldnames = list(metadata.keys())
-        with log_path.open("w", newline="", encoding="utf-8") as f:
+    # Step 3: Open the file once, for reading the header and appending the row
+    ## "a+" creates the file if it doesn't exist and always writes at the end ##
+    with log_path.open("a+", newline="", encoding="utf-8") as f:
+        f.seek(0)
+        first_line = f.readline()
+
+        # Step 4: Write the header if the file is new (or empty)
+        if not first_line:
+            fieldnames = list(metadata.keys())
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerow({k: normalize(v) for k, v in metadata.items()})
-        return
+            return
 
-    # Step 5: For existing file, keep original header order
-    with log_path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        try:
-            existing_header = next(reader)
-        except StopIteration:
-            existing_header = list(metadata.keys())
+        # Step 5: For existing file, keep original header order
+        existing_header = next(csv.reader([first_line]))
 
-    # Step 6: Create a row of the metadata
-    row = {col: normalize(metadata.get(col, "")) for col in existing_header}
+        # Step 6: Create a row of the metadata
+        row = {col: normalize(metadata.get(col, "")) for col in existing_header}
 
-    # Step 7: Write the row to the file
-    with log_path.open("a", newline="", encoding="utf-8") as f:
+        # Step 7: Write the row to the file
         writer = csv.DictWriter(f, fieldnames=existing_header)
         writer.writerow(row)
 
@@ -233,4 +318,3 @@ if __name__ == "__main__":
     print("=" * 50)
     for key, value in result.items():
         print(f"{key}: {value}")
-
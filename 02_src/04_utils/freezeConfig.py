@@ -0,0 +1,74 @@
+# Freezes the pipeline configuration into a Python module #
+## Parses sampleDataConfig.yaml once and writes its contents as plain Python literals to ##
+## sampleDataConfig_compiled.py, so Config can import the dict instead of parsing YAML every run ##
+## Run it again after editing the YAML file, Config ignores a compiled module that is older than the YAML file ##
+
+import yaml
+from pathlib import Path
+from pprint import pformat
+import logging
+import sys
+
+# Module logger, configured in the usage script #
+log = logging.getLogger(__name__)
+
+# Set the path to the configuration file #
+config_yaml_path = (
+    Path(__file__).parent.parent.parent / "05_config" / "sampleDataConfig.yaml"
+)
+
+# Header of the compiled module #
+COMPILED_HEADER = """# Generated by 02_src/04_utils/freezeConfig.py from {source}, do not edit #
+## Edit the YAML file and run freezeConfig.py again instead ##
+
+"""
+
+
+## This is where the compiled module's path is worked out ##
+def compiled_path_for(yaml_path: Path) -> Path:
+    """Gets the path of the compiled module for a YAML configuration file
+
+    Args:
+        yaml_path: The YAML configuration file
+
+    Returns:
+        The compiled module next to it (sampleDataConfig.yaml -> sampleDataConfig_compiled.py)
+    """
+    return yaml_path.with_name(yaml_path.stem + "_compiled.py")
+
+
+## This is where the YAML file is written out as a Python module ##
+def freeze_config(yaml_path: Path) -> Path:
+    """Writes a YAML configuration file as a Python module
+
+    Args:
+        yaml_path: The YAML configuration file
+
+    Returns:
+        The path of the compiled module
+    """
+    with open(yaml_path, "r") as f:
+        config = yaml.safe_load(f)
+
+    # The YAML file's modification time is stored so Config can tell when the module is out of date #
+    source_mtime = yaml_path.stat().st_mtime
+
+    compiled_path = compiled_path_for(yaml_path)
+    with open(compiled_path, "w") as f:
+        f.write(COMPILED_HEADER.format(source=yaml_path.name))
+        f.write(f"SOURCE_MTIME = {source_mtime!r}\n\n")
+        f.write(f"CONFIG = {pformat(config, sort_dicts=False)}\n")
+
+    log.info(f"Froze {yaml_path.name} into {compiled_path.name}")
+    return compiled_path
+
+
+# Usage: python 02_src/04_utils/freezeConfig.py [path/to/sampleDataConfig.yaml] #
+if __name__ == "__main__":
+    # Configure logging once, messages are printed as-is #
+    logging.basicConfig(
+        level=logging.INFO, format="%(message)s", handlers=[logging.StreamHandler()]
+    )
+
+    yaml_path = Path(sys.argv[1]) if len(sys.argv) > 1 else config_yaml_path
+    freeze_config(yaml_path.resolve())
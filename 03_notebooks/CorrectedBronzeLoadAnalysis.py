@@ -3,6 +3,43 @@ import marimo
 __generated_with = "0.19.4"
 app = marimo.App(width="medium")
 
+with app.setup:
+    import os
+    import duckdb
+    from pathlib import Path
+
+
+# get_engine is a top level function, not part of a cell, so the connection it keeps outlives re-runs of the engine cell
+# Re-running that cell hands back the open connection instead of reopening the file
+# The file's mtime is part of the key, so a reloaded database gets a fresh connection
+@app.function
+def get_engine(path, mtime):
+    # The connection is kept with its (path, mtime) key on the function itself
+    current = getattr(get_engine, "current", None)
+    if current is not None:
+        key, connection = current
+        if key == (path, mtime):
+            return connection
+
+        # Close the old connection, so its read lock doesn't block the bronze loader
+        connection.close()
+        get_engine.current = None
+
+    connection = duckdb.connect(path, read_only=True)
+
+    # Tune the connection for the analysis queries
+    # preserve_insertion_order=false lets the GROUP BY and window cells stream rows instead of keeping file order
+    # The notebook spills to its own temp directory, so it never shares one with a running bronze load
+    connection.execute(f"SET threads = {os.cpu_count()}")
+    connection.execute("SET preserve_insertion_order = false")
+    connection.execute("SET enable_object_cache = true")
+    connection.execute(
+        "SET temp_directory = ?", [str(Path(path).parent / "notebook.tmp")]
+    )
+
+    get_engine.current = ((path, mtime), connection)
+    return connection
+
 
 @app.cell
 def _():
@@ -78,9 +115,6 @@ def _(mo):
 
 @app.cell
 def _():
-    import duckdb
-    from pathlib import Path
-
     # Use relative path from project root
     project_root = Path(__file__).parent.parent
     database_path = (
@@ -91,10 +125,32 @@ def _():
         / "secSampleData_bronze.duckdb"
     )
 
-    engine = duckdb.connect(str(database_path), read_only=True)
+    engine = get_engine(str(database_path), os.path.getmtime(database_path))
     return (engine,)
 
 
+@app.cell
+def _(bronze_sub, engine, mo):
+    # Copy the columns the analysis uses into a temp table once, the cells below read the copy
+    # The temp table lives in memory, so the read-only database file isn't changed
+    # form only has a handful of values, as an ENUM the GROUP BY form cells group on a small code instead of a string
+    # The type is temporary too, it's dropped with the table first so the cell can be re-run on the same connection
+    _df = mo.sql(
+        f"""
+        DROP TABLE IF EXISTS bronze_sub_cached;
+        DROP TYPE IF EXISTS form_t;
+        CREATE TEMP TYPE form_t AS ENUM (
+            SELECT DISTINCT form FROM bronze_sub WHERE form IS NOT NULL
+        );
+        CREATE TEMP TABLE bronze_sub_cached AS
+        SELECT adsh, cik, name, form::form_t as form, period, filed, changed, accepted
+        FROM bronze_sub
+        """,
+        engine=engine
+    )
+    return
+
+
 @app.cell
 def _(mo):
     mo.md(r"""
@@ -104,9 +160,28 @@ def _(mo):
 
 
 @app.cell
-def _(bronze_sub, engine, mo):
-    date_check = mo.sql(
-        f"""
+def _(mo):
+    # The distinct counts below are HyperLogLog estimates unless this is switched on
+    exact_distinct_counts = mo.ui.switch(
+        label="Exact distinct counts (slower, otherwise they are estimates)"
+    )
+    exact_distinct_counts
+    return (exact_distinct_counts,)
+
+
+@app.cell
+def _(engine, exact_distinct_counts, mo):
+    # Exact COUNT(DISTINCT) keeps every distinct value in memory, approx_count_distinct keeps a fixed size sketch
+    _distinct = (
+        "COUNT(DISTINCT {})"
+        if exact_distinct_counts.value
+        else "approx_count_distinct({})"
+    )
+
+    # One scan of bronze_sub for the date checks, the table overview and the name vs CIK summary
+    # It's a single row, so it's fetched as a tuple instead of building a DataFrame with mo.sql
+    # engine.execute isn't tracked by marimo, so this reads bronze_sub rather than the temp copy
+    _result = engine.execute(f"""
         SELECT 
             COUNT(*) as total_records,
             COUNT(period) as period_not_null,
@@ -114,18 +189,50 @@ def _(bronze_sub, engine, mo):
             COUNT(changed) as changed_not_null,
             COUNT(*) - COUNT(period) as period_null_count,
             COUNT(*) - COUNT(filed) as filed_null_count,
-            COUNT(*) - COUNT(changed) as changed_null_count
+            COUNT(*) - COUNT(changed) as changed_null_count,
+            {_distinct.format("cik")} as unique_companies,
+            {_distinct.format("name")} as distinct_names,
+            {_distinct.format("form")} as unique_forms
         FROM bronze_sub
-        """,
-        engine=engine
+    """)
+    bronze_sub_stats = dict(
+        zip([_column[0] for _column in _result.description], _result.fetchone())
     )
-    return
+
+    mo.md(f"""
+    | Field | Not null | Null |
+    |---|---|---|
+    | period | {bronze_sub_stats["period_not_null"]:,} | {bronze_sub_stats["period_null_count"]:,} |
+    | filed | {bronze_sub_stats["filed_not_null"]:,} | {bronze_sub_stats["filed_null_count"]:,} |
+    | changed | {bronze_sub_stats["changed_not_null"]:,} | {bronze_sub_stats["changed_null_count"]:,} |
+    """)
+    return (bronze_sub_stats,)
 
 
 @app.cell
-def _(bronze_sub, engine, mo):
-    sample_dates = mo.sql(
-        f"""
+def _(engine):
+    # On its own, MIN/MAX is answered from bronze_sub's min/max statistics without scanning the table
+    # (EXPLAIN shows a one row COLUMN_DATA_SCAN), next to the other aggregates it forces a full scan
+    # It also doesn't re-run when the exact distinct counts switch is changed
+    _result = engine.execute("""
+        SELECT 
+            MIN(period) as earliest_period,
+            MAX(period) as latest_period,
+            MIN(filed) as earliest_filed,
+            MAX(filed) as latest_filed
+        FROM bronze_sub
+    """)
+    bronze_sub_date_range = dict(
+        zip([_column[0] for _column in _result.description], _result.fetchone())
+    )
+    return (bronze_sub_date_range,)
+
+
+@app.cell
+def _(engine, mo):
+    # LIMIT stops reading after 10 rows (USING SAMPLE would scan the whole table to pick them)
+    # The rows go straight into an Arrow table for mo.ui.table, no DataFrame is built
+    sample_dates = engine.execute("""
         SELECT 
             adsh,
             name,
@@ -135,9 +242,8 @@ def _(bronze_sub, engine, mo):
             accepted
         FROM bronze_sub
         LIMIT 10
-        """,
-        engine=engine
-    )
+    """).to_arrow_table()
+    mo.ui.table(sample_dates)
     return
 
 
@@ -179,21 +285,20 @@ def _(mo):
 
 
 @app.cell
-def _(bronze_sub, engine, mo):
-    bronze_sub_summary = mo.sql(
-        f"""
-        SELECT 
-            COUNT(*) as total_submissions,
-            COUNT(DISTINCT cik) as unique_companies,
-            COUNT(DISTINCT form) as unique_forms,
-            MIN(period) as earliest_period,
-            MAX(period) as latest_period,
-            MIN(filed) as earliest_filed,
-            MAX(filed) as latest_filed
-        FROM bronze_sub
-        """,
-        engine=engine
-    )
+def _(bronze_sub_date_range, bronze_sub_stats, mo):
+    # MIN/MAX are NULL when the table is empty or no date parsed, show that instead of failing to format it
+    _dates = {
+        _column: "NULL" if _value is None else f"{_value:%Y-%m-%d}"
+        for _column, _value in bronze_sub_date_range.items()
+    }
+
+    mo.md(f"""
+    - **Total submissions:** {bronze_sub_stats["total_records"]:,}
+    - **Unique companies:** {bronze_sub_stats["unique_companies"]:,}
+    - **Unique forms:** {bronze_sub_stats["unique_forms"]:,}
+    - **Periods:** {_dates["earliest_period"]} to {_dates["latest_period"]}
+    - **Filed:** {_dates["earliest_filed"]} to {_dates["latest_filed"]}
+    """)
     return
 
 
@@ -210,15 +315,65 @@ def _(mo):
 
 
 @app.cell
-def _(bronze_sub, engine, mo):
-    name_cik_summary = mo.sql(
+def _(bronze_sub_stats, exact_distinct_counts, mo):
+    _distinct_names = int(bronze_sub_stats["distinct_names"])
+    _distinct_ciks = int(bronze_sub_stats["unique_companies"])
+
+    # The gap between the two counts is small next to the error of two estimates, so it can even flip sign
+    # It's only worked out from exact counts, the breakdowns below show which names and CIKs are involved
+    if exact_distinct_counts.value:
+        _counts = "exact"
+        _gap = f"""
+    - **Names minus CIKs:** {_distinct_names - _distinct_ciks:,}
+    - **CIKs minus names:** {_distinct_ciks - _distinct_names:,}
+    """
+    else:
+        _counts = "estimated"
+        _gap = """
+    Turn on exact distinct counts above to see the difference between them.
+    """
+
+    mo.md(f"""
+    - **Distinct names ({_counts}):** {_distinct_names:,}
+    - **Distinct CIKs ({_counts}):** {_distinct_ciks:,}
+    {_gap}""")
+    return
+
+
+@app.cell
+def _(bronze_sub_cached, engine, mo):
+    # Both breakdowns below come from this one GROUPING SETS pass over bronze_sub
+    _df = mo.sql(
         f"""
+        -- One row per (name, cik) first, so the CIKs of a name and the names of a CIK are already distinct
+        -- The lists are left in whatever order STRING_AGG sees the rows, only the result rows are sorted
+        -- The CIK is cast to text once per (name, cik) here, not again in the outer query
+        CREATE OR REPLACE TEMP TABLE name_cik_groups AS
+        WITH name_ciks AS (
+            SELECT 
+                name,
+                cik,
+                CAST(cik AS VARCHAR) as cik_text,
+                COUNT(*) as submissions,
+                MIN(filed) as earliest_filing,
+                MAX(filed) as latest_filing
+            FROM bronze_sub_cached
+            GROUP BY name, cik
+        )
+        -- GROUPING(cik) = 1 marks the rows grouped by name, even when the name itself is NULL
         SELECT 
-            COUNT(DISTINCT name) as distinct_names,
-            COUNT(DISTINCT cik) as distinct_ciks,
-            COUNT(DISTINCT name) - COUNT(DISTINCT cik) as name_minus_cik,
-            COUNT(DISTINCT cik) - COUNT(DISTINCT name) as cik_minus_name
-        FROM bronze_sub
+            GROUPING(cik) = 1 as grouped_by_name,
+            name,
+            cik,
+            COUNT(*) as group_count,
+            STRING_AGG(cik_text, ', ') as cik_list,
+            STRING_AGG(name, ' | ') as name_list,
+            SUM(submissions)::BIGINT as total_submissions,
+            MIN(earliest_filing) as earliest_filing,
+            MAX(latest_filing) as latest_filing
+        FROM name_ciks
+        GROUP BY GROUPING SETS ((name), (cik))
+        HAVING COUNT(*) > 1
         """,
         engine=engine
     )
@@ -226,17 +381,16 @@ def _(bronze_sub, engine, mo):
 
 
 @app.cell
-def _(bronze_sub, engine, mo):
+def _(engine, mo, name_cik_groups):
     names_with_multiple_ciks = mo.sql(
         f"""
         SELECT 
             name,
-            COUNT(DISTINCT cik) as cik_count,
-            STRING_AGG(DISTINCT CAST(cik AS VARCHAR), ', ' ORDER BY CAST(cik AS VARCHAR)) as cik_list,
-            COUNT(*) as total_submissions
-        FROM bronze_sub
-        GROUP BY name
-        HAVING COUNT(DISTINCT cik) > 1
+            group_count as cik_count,
+            cik_list,
+            total_submissions
+        FROM name_cik_groups
+        WHERE grouped_by_name
         ORDER BY cik_count DESC, name
         """,
         engine=engine
@@ -245,19 +399,18 @@ def _(bronze_sub, engine, mo):
 
 
 @app.cell
-def _(bronze_sub, engine, mo):
+def _(engine, mo, name_cik_groups):
     ciks_with_multiple_names = mo.sql(
         f"""
         SELECT 
             cik,
-            COUNT(DISTINCT name) as name_count,
-            STRING_AGG(DISTINCT name, ' | ' ORDER BY name) as name_list,
-            COUNT(*) as total_submissions,
-            MIN(filed) as earliest_filing,
-            MAX(filed) as latest_filing
-        FROM bronze_sub
-        GROUP BY cik
-        HAVING COUNT(DISTINCT name) > 1
+            group_count as name_count,
+            name_list,
+            total_submissions,
+            earliest_filing,
+            latest_filing
+        FROM name_cik_groups
+        WHERE NOT grouped_by_name
         ORDER BY name_count DESC, cik
         """,
         engine=engine
@@ -276,23 +429,33 @@ def _(mo):
 
 
 @app.cell
-def _(bronze_sub, engine, mo):
+def _(bronze_sub_cached, engine, mo):
     name_cik_details = mo.sql(
         f"""
+        -- One row per (name, cik, form) first, so the forms of a group are already distinct
+        -- The lists are left in whatever order STRING_AGG sees the rows, only the result rows are sorted
+        -- The window keeps the names with more than one CIK, in the same scan of bronze_sub
+        -- A name has more than one CIK when MIN(cik) and MAX(cik) differ, no distinct set is needed
+        WITH name_cik_forms AS (
+            SELECT 
+                name,
+                cik,
+                form,
+                COUNT(*) as submissions,
+                MIN(filed) as earliest_filing,
+                MAX(filed) as latest_filing
+            FROM bronze_sub_cached
+            GROUP BY name, cik, form
+            QUALIFY MIN(cik) OVER (PARTITION BY name) <> MAX(cik) OVER (PARTITION BY name)
+        )
         SELECT 
             name,
             cik,
-            COUNT(*) as submission_count,
-            MIN(filed) as earliest_filing,
-            MAX(filed) as latest_filing,
-            STRING_AGG(DISTINCT form, ', ' ORDER BY form) as forms_filed
-        FROM bronze_sub
-        WHERE name IN (
-            SELECT name 
-            FROM bronze_sub
-            GROUP BY name
-            HAVING COUNT(DISTINCT cik) > 1
-        )
+            SUM(submissions)::BIGINT as submission_count,
+            MIN(earliest_filing) as earliest_filing,
+            MAX(latest_filing) as latest_filing,
+            STRING_AGG(form, ', ') as forms_filed
+        FROM name_cik_forms
         GROUP BY name, cik
         ORDER BY name, cik
         """,
@@ -312,23 +475,33 @@ def _(mo):
 
 
 @app.cell
-def _(bronze_sub, engine, mo):
+def _(bronze_sub_cached, engine, mo):
     cik_name_details = mo.sql(
         f"""
+        -- One row per (cik, name, form) first, so the forms of a group are already distinct
+        -- The lists are left in whatever order STRING_AGG sees the rows, only the result rows are sorted
+        -- The window keeps the CIKs with more than one name, in the same scan of bronze_sub
+        -- A CIK has more than one name when MIN(name) and MAX(name) differ, no distinct set is needed
+        WITH cik_name_forms AS (
+            SELECT 
+                cik,
+                name,
+                form,
+                COUNT(*) as submissions,
+                MIN(filed) as earliest_filing,
+                MAX(filed) as latest_filing
+            FROM bronze_sub_cached
+            GROUP BY cik, name, form
+            QUALIFY MIN(name) OVER (PARTITION BY cik) <> MAX(name) OVER (PARTITION BY cik)
+        )
         SELECT 
             cik,
             name,
-            COUNT(*) as submission_count,
-            MIN(filed) as earliest_filing,
-            MAX(filed) as latest_filing,
-            STRING_AGG(DISTINCT form, ', ' ORDER BY form) as forms_filed
-        FROM bronze_sub
-        WHERE cik IN (
-            SELECT cik 
-            FROM bronze_sub
-            GROUP BY cik
-            HAVING COUNT(DISTINCT name) > 1
-        )
+            SUM(submissions)::BIGINT as submission_count,
+            MIN(earliest_filing) as earliest_filing,
+            MAX(latest_filing) as latest_filing,
+            STRING_AGG(form, ', ') as forms_filed
+        FROM cik_name_forms
         GROUP BY cik, name
         ORDER BY cik, earliest_filing
         """,
@@ -346,14 +519,14 @@ def _(mo):
 
 
 @app.cell
-def _(bronze_sub, engine, mo):
+def _(bronze_sub_cached, engine, mo):
     multi_submission_companies = mo.sql(
         f"""
         SELECT 
             name,
             cik,
             COUNT(*) as submission_count
-        FROM bronze_sub
+        FROM bronze_sub_cached
         GROUP BY name, cik
         HAVING COUNT(*) > 1
         ORDER BY submission_count DESC
@@ -373,14 +546,14 @@ def _(mo):
 
 
 @app.cell
-def _(bronze_sub, engine, mo):
+def _(bronze_sub_cached, engine, mo):
     forms_distribution = mo.sql(
         f"""
         SELECT 
             form,
             COUNT(*) as count,
             COUNT(DISTINCT cik) as unique_companies
-        FROM bronze_sub
+        FROM bronze_sub_cached
         GROUP BY form
         ORDER BY count DESC
         """,
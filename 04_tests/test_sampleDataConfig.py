@@ -0,0 +1,60 @@
+# Tests for the configuration manager #
+## Run with: python -m pytest 04_tests ##
+
+import shutil
+import sys
+from pathlib import Path
+
+# Set the paths to the configuration and utils folders #
+config_dir = Path(__file__).parent.parent / "05_config"
+utils_dir = Path(__file__).parent.parent / "02_src" / "04_utils"
+
+# Import the configuration file and the freeze script #
+for import_dir in (config_dir, utils_dir):
+    if str(import_dir) not in sys.path:
+        sys.path.insert(0, str(import_dir))
+
+from sampleDataConfig import Config  # noqa: E402
+from freezeConfig import compiled_path_for, freeze_config  # noqa: E402
+
+
+## This is where a copy of the YAML file is set up for each test ##
+def copy_config(tmp_path: Path) -> Path:
+    """Copies sampleDataConfig.yaml into a 05_config folder under tmp_path
+
+    Args:
+        tmp_path: The temporary directory of the test
+
+    Returns:
+        The path to the copied YAML file
+    """
+    (tmp_path / "05_config").mkdir()
+    yaml_path = tmp_path / "05_config" / "sampleDataConfig.yaml"
+    shutil.copy2(config_dir / "sampleDataConfig.yaml", yaml_path)
+    return yaml_path
+
+
+# Changing one Config's dict must not leak into the next Config for the same file #
+def test_config_instances_do_not_share_state(tmp_path):
+    yaml_path = copy_config(tmp_path)
+
+    first = Config(str(yaml_path))
+    first.config["data"]["quarters"].append("9999q9")
+
+    second = Config(str(yaml_path))
+    assert second.config is not first.config
+    assert "9999q9" not in second.config["data"]["quarters"]
+
+
+# The compiled module's CONFIG is one module level dict, each Config still gets its own copy #
+def test_compiled_config_instances_do_not_share_state(tmp_path):
+    yaml_path = copy_config(tmp_path)
+    freeze_config(yaml_path)
+    assert compiled_path_for(yaml_path).exists()
+
+    first = Config(str(yaml_path))
+    first.config["data"]["quarters"].append("9999q9")
+
+    second = Config(str(yaml_path))
+    assert second.config is not first.config
+    assert "9999q9" not in second.config["data"]["quarters"]
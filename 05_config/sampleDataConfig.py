@@ -2,9 +2,62 @@
 ## This is a class that allows me to load the configuration file and use the properties to access the configuration ##
 ## Helps me use seperation of concerns ##
 
-import yaml
+import copy
+import importlib.util
 from pathlib import Path
-from typing import Dict, Any
+from functools import cached_property, lru_cache
+from typing import Dict, Any, Optional
+
+
+## This is where a frozen copy of the YAML file is imported ##
+def _load_compiled(path: Path, mtime: float) -> Optional[Dict[str, Any]]:
+    """Import the compiled module written by 02_src/04_utils/freezeConfig.py
+
+    Returns None when there is no compiled module next to the YAML file, or when it was
+    frozen from a different version of the file (its SOURCE_MTIME doesn't match).
+    The returned dict is the module's own CONFIG, Config._load_config copies it.
+    """
+    compiled_path = path.with_name(path.stem + "_compiled.py")
+    if not compiled_path.exists():
+        return None
+
+    # Set the specification for the compiled module, without one it can't be imported #
+    spec = importlib.util.spec_from_file_location(compiled_path.stem, compiled_path)
+    if spec is None or spec.loader is None:
+        return None
+
+    compiled = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(compiled)
+    if getattr(compiled, "SOURCE_MTIME", None) != mtime:
+        return None
+    return compiled.CONFIG
+
+
+## This is where the YAML file is actually parsed ##
+@lru_cache(maxsize=8)
+def _load(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML configuration file, cached per path and modification time
+
+    Every Config for the same unchanged file shares one parse, editing the file changes
+    its modification time, so the next Config reads it again.
+    The returned dict is shared by every caller, Config._load_config copies it.
+    An up to date compiled module is used instead of the YAML file when there is one.
+    """
+    config = _load_compiled(Path(path), mtime)
+    if config is not None:
+        return config
+
+    # PyYAML is only imported when the YAML file has to be parsed #
+    import yaml
+
+    # Use the C (libyaml) parser when PyYAML was built with it, it is the same safe loader but much faster #
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)  # Safe load to avoid security issues
 
 
 class Config:
@@ -31,61 +84,98 @@ class Config:
 
     ## This is where I load the configuration file ##
     def _load_config(self) -> Dict[str, Any]:
-        """Load YAML configuration"""
-        with open(self.config_path, "r") as f:
-            return yaml.safe_load(f)  # Safe load to avoid security issues
+        """Load YAML configuration
+
+        The parsed (or compiled) dict is cached and shared, so each Config gets its own
+        deep copy, changing one instance's config doesn't change the next one's
+        """
+        return copy.deepcopy(
+            _load(str(self.config_path), self.config_path.stat().st_mtime)
+        )
 
     # Properties for the configuration #
+    ## Each one is worked out from the nested config dict on first use and then stored on the instance, ##
+    ## so later reads are a plain attribute lookup ##
 
     # Checks if the pipeline is in sample mode #
-    @property
+    @cached_property
     def is_sample_mode(self) -> bool:
         return self.config["pipeline"]["mode"] == "sample"
 
     # Gets the path for the bronze layer #
-    @property
+    @cached_property
     def bronze_path(self) -> Path:
         return self.project_root / self.config["data"]["paths"]["bronze"]
 
     # Gets the path for the silver layer #
-    @property
+    @cached_property
     def silver_path(self) -> Path:
         return self.project_root / self.config["data"]["paths"]["silver"]
 
     # Gets the path for the gold layer #
-    @property
+    @cached_property
     def gold_path(self) -> Path:
         return self.project_root / self.config["data"]["paths"]["gold"]
 
     # Gets the path for the bronze database #
-    @property
+    @cached_property
     def bronze_database_path(self) -> Path:
         return self.project_root / self.config["data"]["paths"]["databases"]["bronze"]
 
     # Gets the path for the silver database #
-    @property
+    @cached_property
     def silver_database_path(self) -> Path:
         return self.project_root / self.config["data"]["paths"]["databases"]["silver"]
 
     # Gets the path for the gold database #
-    @property
+    @cached_property
     def gold_database_path(self) -> Path:
         return self.project_root / self.config["data"]["paths"]["databases"]["gold"]
 
     # Backward compatibility: database_path points to bronze database #
-    @property
+    @cached_property
     def database_path(self) -> Path:
         return self.bronze_database_path
 
     # Gets the quarters for the data #
-    @property
+    @cached_property
     def quarters(self) -> list:
         return self.config["data"]["quarters"]
 
     # Gets the files to load for the bronze layer #
-    @property
+    @cached_property
     def bronze_files_to_load(self) -> list:
         return self.config.get("bronze", {}).get(
             "files_to_load", ["sub.txt", "num.txt", "tag.txt", "pre.txt"]
         )
 
+    # Checks if the bronze layer caches the .txt files as .parquet files #
+    @cached_property
+    def bronze_parquet_cache(self) -> bool:
+        return self.config.get("bronze", {}).get("parquet_cache", False)
+
+    # Gets the most quarters the bronze layer loads at the same time, an empty value falls back to 4 #
+    @cached_property
+    def bronze_max_workers(self) -> int:
+        return self.config.get("bronze", {}).get("max_workers") or 4
+
+    # Gets the number of DuckDB threads for the bronze load, None keeps DuckDB's default #
+    @cached_property
+    def bronze_threads(self) -> Optional[int]:
+        return self.config.get("bronze", {}).get("threads")
+
+    # Checks if the bronze layer builds its indexes after loading #
+    @cached_property
+    def bronze_build_indexes(self) -> bool:
+        return self.config.get("bronze", {}).get("build_indexes", False)
+
+    # Gets the DuckDB memory limit for the bronze load (e.g. "8GB"), None keeps DuckDB's default #
+    @cached_property
+    def bronze_memory_limit(self) -> Optional[str]:
+        return self.config.get("bronze", {}).get("memory_limit")
+
+    # Gets the directory DuckDB spills to when the bronze load is larger than memory, None keeps DuckDB's default #
+    @cached_property
+    def bronze_temp_directory(self) -> Optional[Path]:
+        temp_directory = self.config.get("bronze", {}).get("temp_directory")
+        return self.project_root / temp_directory if temp_directory else None